@@ -1,14 +1,33 @@
 import os
-import shutil
+import errno
+import stat
 import json
+import hashlib
 import logging
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk, simpledialog
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, MemoryHandler
 import platform
 import subprocess
 import sys
+import time
+import threading
+import queue
+import ctypes
+import ctypes.util
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
 
 def get_log_path():
     base = Path.home() / ".one_to_many_logs"
@@ -23,6 +42,7 @@ def resource_path(name):
 LOG_FILE = get_log_path()
 MACHINE_LIST_FILE = resource_path("machine_list.json")
 IGNORED_EXTENSIONS_FILE = resource_path("ignored_extensions.json")
+IGNORED_DIRS_FILE = resource_path("ignored_dirs.json")
 
 
 
@@ -39,75 +59,564 @@ formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
 console_handler.setFormatter(formatter)
 file_handler.setFormatter(formatter)
 
+# Buffer file writes so a large sync isn't one write() per record; errors
+# still hit the disk immediately.
+file_buffer = MemoryHandler(capacity=1000, flushLevel=logging.ERROR, target=file_handler)
+
 logger.addHandler(console_handler)
-logger.addHandler(file_handler)
+logger.addHandler(file_buffer)
+
+def json_loads(data: bytes):
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def json_dumps(obj, indent=True) -> bytes:
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
 
 def load_ignored_extensions():
     default_extensions = [".tmp", ".bak", ".log", ".DS_Store"]
     if not os.path.exists(IGNORED_EXTENSIONS_FILE):
         try:
-            with open(IGNORED_EXTENSIONS_FILE, "w") as f:
-                json.dump(default_extensions, f, indent=2)
+            with open(IGNORED_EXTENSIONS_FILE, "wb") as f:
+                f.write(json_dumps(default_extensions))
             logger.info("Created default ignored_extensions.json")
             return default_extensions
         except Exception as e:
             logger.warning(f"Failed to create ignored_extensions.json: {e}")
             return []
     try:
-        with open(IGNORED_EXTENSIONS_FILE, "r") as f:
-            return json.load(f)
+        with open(IGNORED_EXTENSIONS_FILE, "rb") as f:
+            return json_loads(f.read())
     except Exception as e:
         logger.warning(f"Could not load ignored extensions: {e}")
         return []
 
-def count_total_files(src: Path) -> int:
-    total = 0
-    for _, _, files in os.walk(src):
-        total += len(files)
-    return total
+def load_ignored_dirs():
+    default_dirs = [".git", "node_modules", "__pycache__"]
+    if not os.path.exists(IGNORED_DIRS_FILE):
+        try:
+            with open(IGNORED_DIRS_FILE, "wb") as f:
+                f.write(json_dumps(default_dirs))
+            logger.info("Created default ignored_dirs.json")
+            return default_dirs
+        except Exception as e:
+            logger.warning(f"Failed to create ignored_dirs.json: {e}")
+            return []
+    try:
+        with open(IGNORED_DIRS_FILE, "rb") as f:
+            return json_loads(f.read())
+    except Exception as e:
+        logger.warning(f"Could not load ignored directories: {e}")
+        return []
 
-def files_are_identical(src_file: Path, dst_file: Path) -> bool:
+def _scan(src_dir: str, dst_dir: str, ignored_dirs=frozenset()):
+    # Pre-order walk yielding (DirEntry, dst_path). DirEntry caches its stat
+    # result, so callers never stat the same source file twice. Directories
+    # named in ignored_dirs are pruned without being listed at all.
     try:
-        return (
-            src_file.stat().st_size == dst_file.stat().st_size and
-            int(src_file.stat().st_mtime) == int(dst_file.stat().st_mtime)
-        )
+        with os.scandir(src_dir) as it:
+            entries = list(it)
+    except OSError as e:
+        logger.warning(f"Could not list {src_dir}: {e}")
+        return
+    for entry in entries:
+        if entry.name in ignored_dirs and entry.is_dir():
+            logger.debug("Skipped (ignored directory): %s", entry.path)
+            continue
+        dst_path = os.path.join(dst_dir, entry.name)
+        yield entry, dst_path
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan(entry.path, dst_path, ignored_dirs)
+
+def list_dir(path: str) -> dict:
+    # One readdir per destination directory instead of a stat() per file.
+    # Keys are normcased so case-insensitive (Windows/SMB) names still match.
+    try:
+        with os.scandir(path) as it:
+            return {os.path.normcase(e.name): e for e in it}
+    except OSError:
+        return {}
+
+def files_are_identical(src_stat: os.stat_result, dst_entry) -> bool:
+    if dst_entry is None:
+        return False
+    try:
+        dst_stat = dst_entry.stat()
     except FileNotFoundError:
         return False
+    return (
+        src_stat.st_size == dst_stat.st_size and
+        int(src_stat.st_mtime) == int(dst_stat.st_mtime)
+    )
 
-def copy_recursively(src: Path, dst: Path, ignored_exts=None, progress_callback=None):
-    total_files = count_total_files(src)
-    copied = 0
+_BUF_SIZE = 1 << 20
+_buffers = threading.local()
 
-    for root, dirs, files in os.walk(src):
-        rel_root = Path(root).relative_to(src)
-        dst_root = dst / rel_root
+_O_BINARY = getattr(os, "O_BINARY", 0)
+_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.ENOTSUP,
+    errno.EOPNOTSUPP, errno.ENOTSOCK, errno.EBADF,
+}
 
-        for d in dirs:
-            (dst_root / d).mkdir(parents=True, exist_ok=True)
+FICLONE = 0x40049409
 
-        for f in files:
-            if ignored_exts and any(f.lower().endswith(ext.lower()) for ext in ignored_exts):
-                logger.info(f"Skipped (ignored extension): {f}")
-                continue
+def _ficlone(fd_in: int, fd_out: int) -> bool:
+    # Linux reflink (btrfs, XFS, ...): share the source extents, no data copied.
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(fd_out, FICLONE, fd_in)
+        return True
+    except OSError:
+        return False
+
+@functools.lru_cache(maxsize=None)
+def _libc_clonefile():
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fn = libc.clonefile
+    except (OSError, AttributeError):
+        return None
+    fn.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    fn.restype = ctypes.c_int
+    return fn
+
+def _clonefile(src, dst) -> bool:
+    # macOS APFS clone. clonefile() refuses to replace an existing file, so
+    # clone to a scratch name beside dst and rename it over; dst itself is
+    # never touched unless the clone already succeeded.
+    if sys.platform != "darwin":
+        return False
+    fn = _libc_clonefile()
+    if fn is None:
+        return False
+    tmp = f"{dst}.o2m_clone.tmp"
+    src_b, tmp_b = os.fsencode(src), os.fsencode(tmp)
+    if fn(src_b, tmp_b, 0) != 0:
+        if ctypes.get_errno() != errno.EEXIST:
+            return False
+        # Leftover scratch file from an interrupted run.
+        try:
+            os.unlink(tmp)
+        except OSError:
+            return False
+        if fn(src_b, tmp_b, 0) != 0:
+            return False
+    try:
+        os.replace(tmp, dst)
+        return True
+    except OSError:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        return False
 
-            src_file = Path(root) / f
-            dst_file = dst_root / f
+# Below this size readahead hints aren't worth the extra syscalls.
+_FADVISE_MIN = 1 << 20
 
+def _fadvise(fd: int, advice: int):
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
+
+def _get_buffer() -> memoryview:
+    # One preallocated buffer per copy thread, reused for every file it handles.
+    mv = getattr(_buffers, "mv", None)
+    if mv is None:
+        mv = _buffers.mv = memoryview(bytearray(_BUF_SIZE))
+    return mv
+
+def _blocksize(size: int) -> int:
+    return min(max(size, 1 << 23), 1 << 30)
+
+class _GiveUpFastCopy(Exception):
+    # Raised by a zero-copy strategy that transferred nothing, so _copy_fd
+    # moves on to the next one instead of leaving an empty destination.
+    pass
+
+def _zero_copy_loop(call, fd_out: int):
+    first = True
+    while True:
+        n = call()
+        if not n:
+            # Some filesystems report EOF straight away instead of failing.
+            if first and os.lseek(fd_out, 0, os.SEEK_CUR) == 0:
+                raise _GiveUpFastCopy()
+            return
+        first = False
+
+def _copy_range(fd_in: int, fd_out: int, blocksize: int):
+    _zero_copy_loop(lambda: os.copy_file_range(fd_in, fd_out, blocksize), fd_out)
+
+def _copy_sendfile(fd_in: int, fd_out: int, blocksize: int):
+    _zero_copy_loop(lambda: os.sendfile(fd_out, fd_in, None, blocksize), fd_out)
+
+def _copy_readinto(fd_in: int, fd_out: int, blocksize: int):
+    mv = _get_buffer()
+    with open(fd_in, "rb", buffering=0, closefd=False) as f_in:
+        while True:
+            n = f_in.readinto(mv)
+            if not n:
+                break
+            written = 0
+            while written < n:
+                written += os.write(fd_out, mv[written:n])
+
+# Default cascade order: zero-copy syscalls first, userspace buffer last.
+COPY_STRATEGIES = {}
+if hasattr(os, "copy_file_range"):
+    COPY_STRATEGIES["copy_file_range"] = _copy_range
+# Only Linux sendfile() accepts a regular file as the output (and a None
+# offset); macOS/BSD need a socket, same restriction shutil applies.
+if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+    COPY_STRATEGIES["sendfile"] = _copy_sendfile
+COPY_STRATEGIES["readinto"] = _copy_readinto
+
+def _copy_fd(fd_in: int, fd_out: int, size: int, strategy=None):
+    # A known-best strategy goes first; the others stay behind it as the
+    # fallback cascade. Each one resumes from the current file offsets, so a
+    # fallback after a partial transfer picks up where the last left off.
+    order = list(COPY_STRATEGIES)
+    if strategy in COPY_STRATEGIES:
+        order.remove(strategy)
+        order.insert(0, strategy)
+
+    blocksize = _blocksize(size)
+    for i, name in enumerate(order):
+        try:
+            COPY_STRATEGIES[name](fd_in, fd_out, blocksize)
+            return
+        except _GiveUpFastCopy:
+            continue
+        except OSError as e:
+            if e.errno not in _FALLBACK_ERRNOS or i == len(order) - 1:
+                raise
+
+    # Every remaining strategy gave up without transferring anything. That's
+    # only fine for a genuinely empty source; otherwise never report success
+    # for what would be a truncated destination.
+    if os.fstat(fd_in).st_size:
+        raise OSError(errno.EIO, "No copy strategy transferred any data")
+
+# Probe samples stay small: every strategy rewrites all of them to the
+# destination, for every destination, before the real sync starts.
+_PROBE_MIN = 64 << 10
+_PROBE_MAX = 4 << 20
+# A strategy must beat the default cascade by this factor to be adopted, and
+# the decision is re-measured once it is this old.
+_PROBE_MARGIN = 0.8
+_PROBE_TTL = 7 * 24 * 3600
+
+def _probe_strategy(samples, dst_dir: str):
+    # Time every available strategy on the same few real files, written (and
+    # fsync'd, so the destination is really measured rather than the page
+    # cache) to a scratch file in the destination. Returns a strategy name
+    # only if it clearly beats the default cascade, otherwise None.
+    if len(COPY_STRATEGIES) < 2:
+        return None
+    probe = os.path.join(dst_dir, ".o2m_probe.tmp")
+    mv = _get_buffer()
+
+    def copy_sample(fn, src_file, size):
+        fd_in = os.open(src_file, os.O_RDONLY | _O_BINARY)
+        try:
+            fd_out = os.open(probe, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
             try:
-                if not dst_file.exists() or not files_are_identical(src_file, dst_file):
-                    shutil.copy2(src_file, dst_file)
-                    logger.info(f"Copied: {src_file} -> {dst_file}")
-                else:
-                    logger.debug(f"Skipped (identical): {src_file}")
+                fn(fd_in, fd_out, _blocksize(size))
+                os.fsync(fd_out)
+            finally:
+                os.close(fd_out)
+        finally:
+            os.close(fd_in)
+
+    timings = {}
+    try:
+        # Warm the source pages first so the first strategy isn't penalised
+        # for a cold cache.
+        for src_file, _ in samples:
+            with open(src_file, "rb", buffering=0) as f:
+                while f.readinto(mv):
+                    pass
+        for name, fn in COPY_STRATEGIES.items():
+            start = time.perf_counter()
+            try:
+                for src_file, size in samples:
+                    copy_sample(fn, src_file, size)
             except Exception as e:
-                logger.error(f"Error copying {src_file} to {dst_file}: {e}")
+                # Any failure just rules this strategy out; it must never
+                # fail the destination before a single file is copied.
+                logger.debug("Copy strategy %s unusable for %s: %r", name, dst_dir, e)
+                continue
+            timings[name] = time.perf_counter() - start
+    except Exception as e:
+        logger.warning(f"Copy strategy probe failed for {dst_dir}: {e}")
+    finally:
+        try:
+            os.unlink(probe)
+        except OSError:
+            pass
+
+    if not timings:
+        return None
+    default = next(iter(COPY_STRATEGIES))
+    best = min(timings, key=timings.get)
+    if best == default or (default in timings and timings[best] > timings[default] * _PROBE_MARGIN):
+        logger.info(f"Copy strategy for {dst_dir}: default cascade")
+        return None
+    logger.info(f"Copy strategy for {dst_dir}: {best}")
+    return best
+
+def _pick_probe_samples(jobs):
+    # Small, medium and large representatives from the files about to be copied.
+    sized = sorted(
+        (args[1].st_size, args[0]) for _, _, args in jobs
+        if _PROBE_MIN <= args[1].st_size <= _PROBE_MAX
+    )
+    if not sized:
+        return []
+    picks = {sized[0], sized[len(sized) // 2], sized[-1]}
+    return [(src_file, size) for size, src_file in sorted(picks)]
+
+# (strategy or None, probed_at) per destination root, for the rest of the session.
+_strategy_cache = {}
+
+def _fast_copy(src, dst, src_stat: os.stat_result, allow_reflink=True, strategy=None):
+    # src_stat comes from the walk; the source is never stat()ed again here.
+    # Reflinks are tried first and silently fall through to a byte copy when
+    # src and dst aren't on the same clone-capable filesystem.
+    if not (allow_reflink and _clonefile(src, dst)):
+        fd_in = os.open(src, os.O_RDONLY | _O_BINARY)
+        try:
+            fd_out = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o666)
+            try:
+                if not (allow_reflink and _ficlone(fd_in, fd_out)):
+                    # Large files: ask for aggressive readahead. The source
+                    # pages are deliberately kept: other destinations are
+                    # usually reading the same file at the same time.
+                    if hasattr(os, "posix_fadvise") and src_stat.st_size >= _FADVISE_MIN:
+                        _fadvise(fd_in, os.POSIX_FADV_SEQUENTIAL)
+                    _copy_fd(fd_in, fd_out, src_stat.st_size, strategy)
+            finally:
+                os.close(fd_out)
+        finally:
+            os.close(fd_in)
+    os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+    os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+
+def _manifest_path(src: str, dst: str) -> Path:
+    key = hashlib.sha1(f"{src}\0{dst}".encode("utf-8")).hexdigest()[:16]
+    return LOG_FILE.parent / f"manifest_{key}.json"
+
+def _load_manifest(path: Path) -> dict:
+    # {"files": {rel_path: [size, mtime_ns]}, "strategy": name or None,
+    #  "probed_at": unix time of the strategy probe or None}
+    try:
+        with open(path, "rb") as f:
+            data = json_loads(f.read())
+    except FileNotFoundError:
+        return {"files": {}, "strategy": None}
+    except Exception as e:
+        logger.warning(f"Could not load sync manifest {path}: {e}")
+        return {"files": {}, "strategy": None}
+    if "files" not in data:
+        data = {"files": data, "strategy": None}
+    return data
+
+def _save_manifest(path: Path, manifest: dict):
+    tmp = path.with_suffix(".tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(json_dumps(manifest, indent=False))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.warning(f"Failed to save sync manifest {path}: {e}")
 
-            copied += 1
-            if progress_callback:
-                progress_callback(copied, total_files)
+def _sync_file(src_file: str, src_stat: os.stat_result, dst_file: str, dst_entry, made: set,
+               allow_reflink: bool, strategy) -> str:
+    try:
+        if not files_are_identical(src_stat, dst_entry):
+            # Parents are created lazily, so an unchanged tree costs no mkdirs.
+            # Concurrent makedirs of the same parent are harmless with exist_ok.
+            parent = os.path.dirname(dst_file)
+            if parent not in made:
+                os.makedirs(parent, exist_ok=True)
+                made.add(parent)
+            _fast_copy(src_file, dst_file, src_stat, allow_reflink, strategy)
+            logger.debug("Copied: %s -> %s", src_file, dst_file)
+            return "copied"
+        logger.debug("Skipped (identical): %s", src_file)
+        return "skipped"
+    except Exception as e:
+        logger.error(f"Error copying {src_file} to {dst_file}: {e}")
+        return "error"
+
+def copy_recursively(src: Path, dst: Path, ignored_exts=None, progress_callback=None, max_workers=16, use_manifest=True, allow_reflink=True, ignored_dirs=None):
+    # Walk once up front, then copy files concurrently. Destination directories
+    # are only created for files that actually need copying, plus any source
+    # directory with no files beneath it so empty folders still sync.
+    # Paths stay plain strings from here on; Path is only the public interface.
+    src_s = os.fspath(src)
+    dst_s = os.fspath(dst)
+    ignored = tuple(ext.lower() for ext in ignored_exts or ())
+    pruned = frozenset(ignored_dirs or ())
+
+    # The manifest remembers each source file's (size, mtime_ns) as of the last
+    # successful sync to this destination, so unchanged files are skipped
+    # without touching the destination at all.
+    manifest_file = _manifest_path(src_s, dst_s) if use_manifest else None
+    saved = _load_manifest(manifest_file) if manifest_file else {"files": {}, "strategy": None}
+    old_manifest = saved["files"]
+    manifest = {}
+
+    results = {"copied": 0, "skipped": 0, "error": 0}
+    # Reflinks only work within one filesystem; don't even try when the
+    # source file lives on a different device than the destination root.
+    try:
+        dst_dev = os.stat(dst_s).st_dev
+    except OSError:
+        dst_dev = None
+
+    made = set()
+    listings = {}
+    dirs = []
+    filled = set()
+    jobs = []
+    for entry, dst_path in _scan(src_s, dst_s, pruned):
+        if entry.is_dir():
+            dirs.append(dst_path)
+            continue
+
+        f = entry.name
+        if ignored and f.lower().endswith(ignored):
+            logger.debug("Skipped (ignored extension): %s", f)
+            continue
+
+        src_file = entry.path
+        try:
+            src_stat = entry.stat()
+        except OSError as e:
+            logger.error(f"Error copying {src_file} to {dst_path}: {e}")
+            results["error"] += 1
+            continue
+
+        dst_dir = os.path.dirname(dst_path)
+        parent = dst_dir
+        while len(parent) > len(dst_s) and parent not in filled:
+            filled.add(parent)
+            parent = os.path.dirname(parent)
+
+        listing = listings.get(dst_dir)
+        if listing is None:
+            listing = listings[dst_dir] = list_dir(dst_dir)
+        dst_entry = listing.get(os.path.normcase(f))
+
+        # A manifest hit only counts if the file is still at the destination
+        # (checked against the per-directory listing, so no extra stat).
+        rel = dst_path[len(dst_s):].lstrip("/\\")
+        sig = [src_stat.st_size, src_stat.st_mtime_ns]
+        if dst_entry is not None and old_manifest.get(rel) == sig:
+            manifest[rel] = sig
+            results["skipped"] += 1
+            logger.debug("Skipped (unchanged since last sync): %s", src_file)
+            continue
+        reflink = allow_reflink and dst_dev is not None and src_stat.st_dev == dst_dev
+        jobs.append((rel, sig, [src_file, src_stat, dst_path, dst_entry, made, reflink, None]))
+
+    for d in dirs:
+        if d not in filled:
+            os.makedirs(d, exist_ok=True)
+
+    # Byte-copy primitive for this destination: remembered from earlier syncs,
+    # or measured on a few of the files about to be copied. A decision older
+    # than _PROBE_TTL, or naming a strategy this platform lacks, is re-probed.
+    choice = _strategy_cache.get(dst_s)
+    if choice is None and saved.get("probed_at"):
+        choice = (saved.get("strategy"), saved["probed_at"])
+    if choice and (time.time() - choice[1] > _PROBE_TTL or
+                   (choice[0] is not None and choice[0] not in COPY_STRATEGIES)):
+        choice = None
+    if choice is None:
+        samples = _pick_probe_samples(jobs)
+        if samples:
+            choice = (_probe_strategy(samples, dst_s), time.time())
+    strategy = choice[0] if choice else None
+    if choice:
+        _strategy_cache[dst_s] = choice
+    if strategy:
+        for _, _, args in jobs:
+            args[-1] = strategy
+
+    unchanged = len(manifest)
+    total_files = unchanged + len(jobs)
+    done = unchanged
+    if progress_callback and unchanged:
+        progress_callback(done, total_files)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futs = {ex.submit(_sync_file, *args): (rel, sig) for rel, sig, args in jobs}
+            for fut in as_completed(futs):
+                result = fut.result()
+                results[result] += 1
+                if result != "error":
+                    rel, sig = futs[fut]
+                    manifest[rel] = sig
+                done += 1
+                if progress_callback:
+                    progress_callback(done, total_files)
+    finally:
+        if manifest_file:
+            _save_manifest(manifest_file, {
+                "files": manifest,
+                "strategy": strategy,
+                "probed_at": choice[1] if choice else None,
+            })
+
+    logger.info(
+        f"Sync summary for {dst_s}: {results['copied']} copied, "
+        f"{results['skipped']} skipped, {results['error']} errors"
+    )
+
+def unc_server(share_path: str) -> str:
+    # \\host\share\dir -> \\host; credentials are shared per server.
+    host = share_path.replace("/", "\\").lstrip("\\").split("\\", 1)[0]
+    return "\\\\" + host.lower()
+
+def ask_credentials(share_path: str):
+    username = simpledialog.askstring("Credentials", f"Enter username for {share_path} (DOMAIN\\\\user):", show=None)
+    password = simpledialog.askstring("Credentials", f"Enter password for {username}:", show='*')
+
+    if not username or not password:
+        messagebox.showerror("Error", "Username and password required to map share.")
+        return None
+    return username, password
+
+def net_use(share_path: str, username: str, password: str) -> bool:
+    # No shell: the password is passed as an argument and must not be
+    # interpreted by cmd.exe.
+    try:
+        result = subprocess.run(
+            ["net", "use", share_path, password, f"/user:{username}"],
+            capture_output=True,
+            text=True,
+            shell=False
+        )
+        if result.returncode == 0:
+            logger.info(f"Successfully mapped: {share_path}")
+            return True
+        else:
+            logger.warning(f"Failed to map {share_path}:\n{result.stderr}")
+    except Exception as e:
+        logger.error(f"Exception during 'net use': {e}")
+    return False
 
-def ensure_path_mapped(share_path: str, host_type: str = "smb") -> bool:
+def ensure_path_mapped(share_path: str, host_type: str = "smb", credentials=None) -> bool:
+    # Prompts for credentials (Tk) unless they are passed in, so only call it
+    # without credentials from the Tk thread.
     if host_type == "local":
         return os.path.exists(share_path)
 
@@ -119,28 +628,13 @@ def ensure_path_mapped(share_path: str, host_type: str = "smb") -> bool:
     if system == "Windows":
         logger.info(f"Trying to map Windows share: {share_path}")
 
-        username = simpledialog.askstring("Credentials", f"Enter username for {share_path} (DOMAIN\\\\user):", show=None)
-        password = simpledialog.askstring("Credentials", f"Enter password for {username}:", show='*')
-
-        if not username or not password:
-            messagebox.showerror("Error", "Username and password required to map share.")
-            return False
+        if credentials is None:
+            credentials = ask_credentials(share_path)
+            if credentials is None:
+                return False
 
-        try:
-            result = subprocess.run(
-                ["net", "use", share_path, password, f"/user:{username}"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                shell=True
-            )
-            if result.returncode == 0:
-                logger.info(f"Successfully mapped: {share_path}")
-                return True
-            else:
-                logger.warning(f"Failed to map {share_path}:\n{result.stderr}")
-        except Exception as e:
-            logger.error(f"Exception during 'net use': {e}")
+        if net_use(share_path, *credentials):
+            return True
 
     elif system in ("Linux", "Darwin"):
         logger.warning(f"UNC path '{share_path}' not accessible on {system}. Must be mounted manually.")
@@ -148,10 +642,11 @@ def ensure_path_mapped(share_path: str, host_type: str = "smb") -> bool:
     return os.path.exists(share_path)
 
 class HostManager(tk.Toplevel):
-    def __init__(self, parent, machine_vars):
+    def __init__(self, parent, machine_vars, machines=()):
         super().__init__(parent)
         self.title("Manage Hosts")
         self.machine_vars = machine_vars
+        self.machines = machines
         self.modified = False
 
         self.geometry("720x350")
@@ -188,9 +683,9 @@ class HostManager(tk.Toplevel):
         self.load_existing()
 
     def load_existing(self):
-        self.host_listbox.delete(0, tk.END)
-        for name, (_, path, htype) in self.machine_vars.items():
-            self.host_listbox.insert(tk.END, f"{name} | {path} | {htype}")
+        # One Tcl call for the whole list.
+        lines = [f"{name} | {path} | {htype}" for name, (_, path, htype) in self.machine_vars.items()]
+        self.host_listbox.insert(tk.END, *lines)
 
     def add_host(self):
         name = self.name_entry.get().strip()
@@ -222,6 +717,24 @@ class HostManager(tk.Toplevel):
         self.host_listbox.delete(sel[0])
         self.modified = True
 
+    def save_and_close(self):
+        if self.modified:
+            # Keep any extra per-host settings (e.g. allow_reflink) from the file.
+            existing = {m["name"]: m for m in self.machines}
+            machines = []
+            for name, (_, path, htype) in self.machine_vars.items():
+                record = dict(existing.get(name, {}))
+                record.update(name=name, path=path, type=htype)
+                machines.append(record)
+            try:
+                with open(MACHINE_LIST_FILE, "wb") as f:
+                    f.write(json_dumps(machines))
+                logger.info("Updated machine_list.json")
+            except Exception as e:
+                logger.error(f"Failed to save machine list: {e}")
+                messagebox.showerror("Error", f"Could not save machine list:\n{e}")
+        self.destroy()
+
 class ExtensionManager(tk.Toplevel):
     def __init__(self, parent, extension_list):
         super().__init__(parent)
@@ -248,9 +761,7 @@ class ExtensionManager(tk.Toplevel):
         self.load_existing()
 
     def load_existing(self):
-        self.listbox.delete(0, tk.END)
-        for ext in self.extension_list:
-            self.listbox.insert(tk.END, ext)
+        self.listbox.insert(tk.END, *self.extension_list)
     def add_extension(self):
         ext = self.entry.get().strip()
         if not ext.startswith("."):
@@ -275,8 +786,8 @@ class ExtensionManager(tk.Toplevel):
     def save_and_close(self):
         if self.modified:
             try:
-                with open(IGNORED_EXTENSIONS_FILE, "w") as f:
-                    json.dump(self.extension_list, f, indent=2)
+                with open(IGNORED_EXTENSIONS_FILE, "wb") as f:
+                    f.write(json_dumps(self.extension_list))
                 logger.info("Updated ignored_extensions.json")
             except Exception as e:
                 logger.error(f"Failed to save ignored extensions: {e}")
@@ -291,7 +802,17 @@ class CopyApp:
         self.source_path = None
         self.machine_vars = {}
         self.loaded_machines = []
+        self._machine_list_mtime = None
+        self._allow_reflink = {}
         self.ignored_extensions = load_ignored_extensions()
+        self.ignored_dirs = load_ignored_dirs()
+        self._progress_lock = threading.Lock()
+        self._progress_counts = {}
+        self._last_ui = 0.0
+        self._last_pct = -1
+        self._copy_thread = None
+        self._cred_cache = {}
+        self._copy_errors = queue.Queue()
 
         tk.Button(root, text="Select Source Folder", command=self.select_source).pack(pady=5)
         self.source_label = tk.Label(root, text="No source selected", fg="blue")
@@ -305,34 +826,53 @@ class CopyApp:
         self.progress = ttk.Progressbar(root, length=400, mode="determinate")
         self.progress.pack(pady=10)
 
-        tk.Button(root, text="Start Sync", command=self.start_copy).pack(pady=5)
+        self.start_button = tk.Button(root, text="Start Sync", command=self.start_copy)
+        self.start_button.pack(pady=5)
         tk.Button(root, text="Manage Hosts", command=self.open_host_manager).pack(pady=5)
         tk.Button(root, text="Manage Ignored Extensions", command=self.open_extension_manager).pack(pady=5)
 
-    def refresh_machine_list(self):
+    def refresh_machine_list(self, force=False):
+        # Nothing to re-read or rebuild if the file is unchanged since the last
+        # load. force is for when machine_vars was edited in memory (e.g. the
+        # host manager was closed without a successful save) and the widgets
+        # must be rebuilt from the file regardless.
+        try:
+            st = os.stat(MACHINE_LIST_FILE)
+            mtime = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            mtime = None
+        if not force and mtime is not None and mtime == self._machine_list_mtime:
+            return
+        self._machine_list_mtime = mtime
+
         for widget in self.machine_frame.winfo_children():
             widget.destroy()
         try:
-            with open(MACHINE_LIST_FILE, "r") as f:
-                machines = json.load(f)
+            with open(MACHINE_LIST_FILE, "rb") as f:
+                machines = json_loads(f.read())
         except Exception as e:
             logger.error(f"Failed to load machine list: {e}")
             machines = []
 
         self.loaded_machines = machines
         self.machine_vars.clear()
+        self._allow_reflink.clear()
         for machine in machines:
             name = machine["name"]
             path = machine["path"]
             htype = machine.get("type", "smb")
+            self._allow_reflink[name] = machine.get("allow_reflink", True)
             var = tk.BooleanVar()
             cb = tk.Checkbutton(self.machine_frame, text=f"{name} ({path}, type={htype})", variable=var)
             cb.pack(anchor="w")
             self.machine_vars[name] = (var, path, htype)
 
     def open_host_manager(self):
-        HostManager(self.root, self.machine_vars).wait_window()
-        self.refresh_machine_list()
+        hm = HostManager(self.root, self.machine_vars, self.loaded_machines)
+        hm.wait_window()
+        # Unmodified: still pick up edits made to machine_list.json outside
+        # the app; the mtime check makes this free when nothing changed.
+        self.refresh_machine_list(force=hm.modified)
 
     def select_source(self):
         folder = filedialog.askdirectory(title="Select Source Folder")
@@ -343,10 +883,20 @@ class CopyApp:
     def update_progress(self, current, total):
         if total == 0:
             return
-        self.progress["value"] = int((current / total) * 100)
-        self.root.update_idletasks()
+        # Redraw at most ~30 times a second, and only when the percentage moves.
+        now = time.monotonic()
+        if now - self._last_ui < 0.033 and current != total:
+            return
+        self._last_ui = now
+        pct = int((current / total) * 100)
+        if pct == self._last_pct:
+            return
+        self._last_pct = pct
+        self.progress["value"] = pct
 
     def start_copy(self):
+        if self._copy_thread and self._copy_thread.is_alive():
+            return
         if not self.source_path or not self.source_path.exists():
             messagebox.showerror("Error", "Source path is not valid.")
             return
@@ -356,23 +906,116 @@ class CopyApp:
             messagebox.showerror("Error", "No destination machines selected.")
             return
 
-        for name, dst_base, htype in selected:
-            if not ensure_path_mapped(str(dst_base), htype):
+        mapped = self._map_destinations(selected)
+
+        if not mapped:
+            messagebox.showinfo("Done", "Sync completed.")
+            return
+
+        self.progress["value"] = 0
+        self._progress_counts = {}
+        self._last_pct = -1
+        self.start_button.config(state="disabled")
+        # Snapshot everything the workers read, so editing hosts or filters
+        # mid-sync can't give destinations in one run different settings.
+        filters = (list(self.ignored_extensions), list(self.ignored_dirs))
+        self._copy_thread = threading.Thread(
+            target=self._do_copy,
+            args=(self.source_path, mapped, dict(self._allow_reflink), filters),
+            daemon=True,
+        )
+        self._copy_thread.start()
+        self.root.after(50, self._poll_copy)
+
+    def _map_destinations(self, selected):
+        workers = min(16, len(selected))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            reachable = list(ex.map(lambda d: os.path.exists(str(d[1])), selected))
+
+        # Credential prompts are Tk dialogs, so they happen here on the Tk
+        # thread, once per server; the cache carries them across syncs.
+        creds = {}
+        if platform.system() == "Windows":
+            for (name, dst_base, htype), ok in zip(selected, reachable):
+                server = unc_server(str(dst_base))
+                if ok or htype == "local" or server in creds:
+                    continue
+                creds[server] = self._cred_cache.get(server) or ask_credentials(str(dst_base))
+
+        def map_one(dst):
+            name, dst_base, htype = dst
+            server = unc_server(str(dst_base))
+            if platform.system() == "Windows" and htype != "local" and not creds.get(server):
+                return False
+            return ensure_path_mapped(str(dst_base), htype, credentials=creds.get(server))
+
+        unreachable = [dst for dst, ok in zip(selected, reachable) if not ok]
+        with ThreadPoolExecutor(max_workers=max(1, min(16, len(unreachable)))) as ex:
+            results = dict(zip((d[1] for d in unreachable), ex.map(map_one, unreachable)))
+
+        mapped = []
+        for (name, dst_base, htype), ok in zip(selected, reachable):
+            server = unc_server(str(dst_base))
+            if not ok and not results[dst_base]:
+                if htype != "local":
+                    self._cred_cache.pop(server, None)
                 logger.error(f"Cannot access or map destination: {dst_base}")
                 messagebox.showerror("Mapping Failed", f"Could not access or map: {dst_base}")
                 continue
-
+            if htype != "local" and creds.get(server):
+                self._cred_cache[server] = creds[server]
+            mapped.append((name, dst_base))
+        return mapped
+
+    def _do_copy(self, src, mapped, allow_reflink, filters):
+        # Background thread: never touches Tk. Failures are queued for _poll_copy.
+        dest_workers = min(16, len(mapped))
+        # Split one budget of file copies across destinations, not 16 each.
+        file_workers = max(2, 32 // dest_workers)
+        with ThreadPoolExecutor(max_workers=dest_workers) as ex:
+            futs = {ex.submit(self._sync_one, name, src, dst_base, filters, allow_reflink.get(name, True), file_workers): (name, dst_base) for name, dst_base in mapped}
+            for fut in as_completed(futs):
+                name, dst_base = futs[fut]
+                try:
+                    fut.result()
+                except Exception as e:
+                    logger.error(f"Error copying to {dst_base}: {e}")
+                    self._copy_errors.put((name, e))
+        file_buffer.flush()
+
+    def _poll_copy(self):
+        running = self._copy_thread.is_alive()
+        while True:
             try:
-                self.progress["value"] = 0
-                logger.info(f"Starting sync to {name}: {dst_base}")
-                copy_recursively(self.source_path, dst_base, ignored_exts=self.ignored_extensions, progress_callback=self.update_progress)
-                logger.info(f"Completed sync to {name}")
-            except Exception as e:
-                logger.error(f"Error copying to {dst_base}: {e}")
-                messagebox.showerror("Copy Failed", f"{name} failed:\n{e}")
+                name, e = self._copy_errors.get_nowait()
+            except queue.Empty:
+                break
+            messagebox.showerror("Copy Failed", f"{name} failed:\n{e}")
+
+        with self._progress_lock:
+            counts = list(self._progress_counts.values())
+        self.update_progress(sum(c for c, _ in counts), sum(t for _, t in counts))
+
+        if running:
+            self.root.after(50, self._poll_copy)
+            return
 
         messagebox.showinfo("Done", "Sync completed.")
         self.progress["value"] = 0
+        self.start_button.config(state="normal")
+
+    def _sync_one(self, name, src, dst_base, filters, allow_reflink=True, file_workers=16):
+        # Runs on a worker thread: only record counts here, the Tk thread draws them.
+        def on_progress(current, total):
+            with self._progress_lock:
+                self._progress_counts[name] = (current, total)
+
+        ignored_exts, ignored_dirs = filters
+        logger.info(f"Starting sync to {name}: {dst_base}")
+        copy_recursively(src, dst_base, ignored_exts=ignored_exts, progress_callback=on_progress,
+                         allow_reflink=allow_reflink, ignored_dirs=ignored_dirs, max_workers=file_workers)
+        logger.info(f"Completed sync to {name}")
+
     def open_extension_manager(self):
         ExtensionManager(self.root, self.ignored_extensions).wait_window()
 